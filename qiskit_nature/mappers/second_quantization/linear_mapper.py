@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2021.
+# (C) Copyright IBM 2021, 2026.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -15,13 +15,13 @@
 import operator
 
 from fractions import Fraction
-from functools import reduce
-from typing import List, Union
+from functools import lru_cache, reduce
+from typing import Dict, List, Tuple, Union
 
 import numpy as np
 
 from qiskit.opflow import PauliSumOp
-from qiskit.quantum_info.operators import Pauli, SparsePauliOp
+from qiskit.quantum_info.operators import Pauli, PauliList, SparsePauliOp
 from qiskit_nature.operators.second_quantization import SpinOp
 from .spin_mapper import SpinMapper
 
@@ -33,45 +33,159 @@ class LinearMapper(SpinMapper):  # pylint: disable=missing-class-docstring
 
     def map(self, second_q_op: SpinOp) -> PauliSumOp:
 
-        qubit_ops_list: List[PauliSumOp] = []
-
         # get linear encoding of the general spin matrices
         spinx, spiny, spinz, identity = self._linear_encoding(second_q_op.spin)
 
-        for idx, (_, coeff) in enumerate(second_q_op.to_list()):
-
-            operatorlist: List[PauliSumOp] = []
-
-            for n_x, n_y, n_z in zip(second_q_op.x[idx], second_q_op.y[idx], second_q_op.z[idx]):
-
-                operator_on_spin_i: List[PauliSumOp] = []
-
-                if n_x > 0:
-                    operator_on_spin_i.append(reduce(operator.matmul, [spinx] * int(n_x)))
+        # the exponents (n_x, n_y, n_z) of all terms and spin systems
+        exponents = np.stack((second_q_op.x, second_q_op.y, second_q_op.z), axis=-1)
+
+        # The operator acting on a single spin system only depends on its exponents. Thus, it is
+        # computed once for every distinct combination of exponents occurring in this operator
+        # rather than once per term and spin system.
+        patterns, pattern_indices = np.unique(exponents.reshape(-1, 3), axis=0, return_inverse=True)
+        pattern_indices = pattern_indices.reshape(exponents.shape[:2])
+
+        # precompute the powers of the encoded spin operators which occur in this operator
+        powers_x, powers_y, powers_z = (
+            {
+                int(power): self._operator_power(spin_matrix, int(power))
+                for power in np.unique(patterns[:, axis])
+                if power > 0
+            }
+            for axis, spin_matrix in enumerate((spinx, spiny, spinz))
+        )
+
+        operators_on_spin: Dict[int, SparsePauliOp] = {}
+        for pattern, (n_x, n_y, n_z) in enumerate(patterns):
+
+            if not np.any([n_x, n_y, n_z]):
+                # If n_x=n_y=n_z=0, the embedded Identity operator acts on the spin system.
+                continue
+
+            operator_on_spin_i: List[SparsePauliOp] = []
+
+            if n_x > 0:
+                operator_on_spin_i.append(powers_x[int(n_x)])
+
+            if n_y > 0:
+                operator_on_spin_i.append(powers_y[int(n_y)])
+
+            if n_z > 0:
+                operator_on_spin_i.append(powers_z[int(n_z)])
+
+            single_operator_on_spin_i = reduce(operator.matmul, operator_on_spin_i)
+            operators_on_spin[pattern] = single_operator_on_spin_i.simplify()
+
+        num_sites = second_q_op.register_length
+        site_qubits = identity.num_qubits
+
+        # collect the operators acting non-trivially on the individual spin systems of every term
+        operators_on_sites: List[Dict[int, SparsePauliOp]] = [
+            {
+                site: operators_on_spin[index]
+                for site, index in enumerate(term_indices)
+                if index in operators_on_spin
+            }
+            for term_indices in pattern_indices
+        ]
+
+        # The symplectic representation of all terms is written into arrays allocated up front, such
+        # that the resulting operator is constructed and simplified only a single time.
+        num_paulis = [
+            int(np.prod([len(site_op) for site_op in site_ops.values()]))
+            for site_ops in operators_on_sites
+        ]
+        offsets = np.concatenate(([0], np.cumsum(num_paulis)))
+        z = np.zeros((offsets[-1], num_sites * site_qubits), dtype=bool)
+        x = np.zeros_like(z)
+        coeffs = np.zeros(offsets[-1], dtype=complex)
+
+        for (_, coeff), site_ops, start, end in zip(
+            second_q_op.to_list(), operators_on_sites, offsets[:-1], offsets[1:]
+        ):
+            term_coeffs = self._tensor_sites(site_ops, site_qubits, z[start:end], x[start:end])
+            coeffs[start:end] = coeff * term_coeffs
+
+        # only remove exactly cancelling terms, such that small coefficients are preserved
+        qubit_op = PauliSumOp(
+            SparsePauliOp(PauliList.from_symplectic(z, x), coeffs).simplify(atol=0.0)
+        )
 
-                if n_y > 0:
-                    operator_on_spin_i.append(reduce(operator.matmul, [spiny] * int(n_y)))
-
-                if n_z > 0:
-                    operator_on_spin_i.append(reduce(operator.matmul, [spinz] * int(n_z)))
-
-                if np.any([n_x, n_y, n_z]) > 0:
-                    single_operator_on_spin_i = reduce(operator.matmul, operator_on_spin_i)
-                    operatorlist.append(single_operator_on_spin_i.reduce())
-
-                else:
-                    # If n_x=n_y=n_z=0, simply add the embedded Identity operator.
-                    operatorlist.append(identity)
+        return qubit_op
 
-            # Now, we can tensor all operators in this list
-            # NOTE: in Qiskit's opflow the `XOR` (i.e. `^`) operator does the tensor product
-            qubit_ops_list.append(coeff * reduce(operator.xor, reversed(operatorlist)))
+    @staticmethod
+    def _tensor_sites(
+        site_ops: Dict[int, SparsePauliOp], site_qubits: int, z: np.ndarray, x: np.ndarray
+    ) -> np.ndarray:
+        """
+        Computes the tensor product of the operators acting on the individual spin systems, where
+        the operator of the first spin system acts on the least significant qubits. All spin
+        systems not contained in `site_ops` are acted upon by the identity.
+        Rather than performing one tensor product per spin system, the symplectic representation of
+        the result is filled in a single pass: the pauli rows of every non-trivial spin system are
+        broadcast such that each combination of terms occurs exactly once, and the coefficients are
+        combined via a Kronecker product.
+
+        Args:
+            site_ops: the operators acting non-trivially, indexed by their spin system.
+            site_qubits: the number of qubits encoding a single spin system.
+            z: the zero-initialized, contiguous array into which the Z-part of the resulting paulis
+                is written. Its shape must be `(number of resulting paulis, number of qubits)`.
+            x: the zero-initialized array into which the X-part of the resulting paulis is written.
+                Its shape must match the one of `z`.
 
-        qubit_op = reduce(operator.add, qubit_ops_list)
+        Returns:
+            The coefficients of the resulting paulis.
+        """
+        total_terms = z.shape[0]
+        preceding = 1
+        for site, site_op in site_ops.items():
+            site_terms = len(site_op)
+            following = total_terms // (preceding * site_terms)
+            qubits = slice(site * site_qubits, (site + 1) * site_qubits)
+            # view the rows as (preceding, site_terms, following) blocks and broadcast the paulis of
+            # this spin system into them without materializing repeated copies
+            shape = (preceding, site_terms, following, z.shape[1])
+            z.reshape(shape)[..., qubits] = site_op.paulis.z[np.newaxis, :, np.newaxis, :]
+            x.reshape(shape)[..., qubits] = site_op.paulis.x[np.newaxis, :, np.newaxis, :]
+            preceding *= site_terms
+
+        # a term without any non-trivial operator is the identity, which has a unit coefficient
+        return reduce(
+            np.kron, [site_op.coeffs for site_op in site_ops.values()], np.ones(1, dtype=complex)
+        )
+
+    @staticmethod
+    def _operator_power(op: SparsePauliOp, power: int) -> SparsePauliOp:
+        """
+        Computes a positive integer power of an operator via binary exponentiation, i.e. by
+        repeatedly squaring it, which requires only logarithmically many compositions.
 
-        return qubit_op
+        Args:
+            op: the operator to exponentiate.
+            power: the positive exponent.
 
-    def _linear_encoding(self, spin: Union[Fraction, float]) -> List[PauliSumOp]:
+        Returns:
+            The operator `op` raised to `power`.
+        """
+        if power == 1:
+            # never hand out the (possibly cached) input itself, which must not be mutated
+            return op.copy()
+
+        result = op
+        base = op
+        remaining = power - 1
+        while remaining:
+            if remaining & 1:
+                result = (result @ base).simplify()
+            remaining >>= 1
+            if remaining:
+                base = (base @ base).simplify()
+        return result
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _linear_encoding(spin: Union[Fraction, float]) -> Tuple[SparsePauliOp, ...]:
         """
         Generates a 'linear_encoding' of the spin S operators 'X', 'Y', 'Z' and 'identity'
         to qubit operators (linear combinations of pauli strings).
@@ -79,13 +193,17 @@ class LinearMapper(SpinMapper):  # pylint: disable=missing-class-docstring
         2S+1 qubits and the state |s> is mapped to the state |00...010..00>, where the s-th qubit is
         in state 1.
 
+        The encoding only depends on the spin number, hence it is cached and shared across all
+        calls to :meth:`map` with operators of the same spin. The returned operators must therefore
+        never be modified in place.
+
         Returns:
-            The 4-element list of transformed spin S 'X', 'Y', 'Z' and 'identity' operators.
+            The 4-element tuple of transformed spin S 'X', 'Y', 'Z' and 'identity' operators.
             I.e. spin_op_encoding[0]` corresponds to the linear combination of pauli strings needed
             to represent the embedded 'X' operator
         """
 
-        spin_op_encoding: List[PauliSumOp] = []
+        spin_op_encoding: List[SparsePauliOp] = []
         dspin = int(2 * spin + 1)
         nqubits = dspin
 
@@ -105,39 +223,31 @@ class LinearMapper(SpinMapper):  # pylint: disable=missing-class-docstring
         x_summands = []
         for i, coeff in enumerate(np.diag(SpinOp("X", spin=spin).to_matrix(), 1)):
             x_summands.append(
-                PauliSumOp(
-                    coeff / 2.0 * SparsePauliOp(pauli_x(i).dot(pauli_x(i + 1)))
-                    + coeff / 2.0 * SparsePauliOp(pauli_y(i).dot(pauli_y(i + 1)))
-                )
+                coeff / 2.0 * SparsePauliOp(pauli_x(i).dot(pauli_x(i + 1)))
+                + coeff / 2.0 * SparsePauliOp(pauli_y(i).dot(pauli_y(i + 1)))
             )
-        spin_op_encoding.append(reduce(operator.add, x_summands))
+        spin_op_encoding.append(SparsePauliOp.sum(x_summands).simplify())
 
         # 2. build the non-diagonal Y operator
         y_summands = []
         for i, coeff in enumerate(np.diag(SpinOp("Y", spin=spin).to_matrix(), 1)):
             y_summands.append(
-                PauliSumOp(
-                    -1j * coeff / 2.0 * SparsePauliOp(pauli_x(i).dot(pauli_y(i + 1)))
-                    + 1j * coeff / 2.0 * SparsePauliOp(pauli_y(i).dot(pauli_x(i + 1)))
-                )
+                -1j * coeff / 2.0 * SparsePauliOp(pauli_x(i).dot(pauli_y(i + 1)))
+                + 1j * coeff / 2.0 * SparsePauliOp(pauli_y(i).dot(pauli_x(i + 1)))
             )
-        spin_op_encoding.append(reduce(operator.add, y_summands))
+        spin_op_encoding.append(SparsePauliOp.sum(y_summands).simplify())
 
         # 3. build the diagonal Z
         z_summands = []
         for i, coeff in enumerate(np.diag(SpinOp("Z", spin=spin).to_matrix())):
             # get the first upper diagonal of coeff.
             z_summands.append(
-                PauliSumOp(
-                    coeff / 2.0 * SparsePauliOp(pauli_z(i)) + coeff / 2.0 * SparsePauliOp(pauli_id)
-                )
+                coeff / 2.0 * SparsePauliOp(pauli_z(i)) + coeff / 2.0 * SparsePauliOp(pauli_id)
             )
-
-        z_operator = reduce(operator.add, z_summands)
-        spin_op_encoding.append(z_operator)
+        spin_op_encoding.append(SparsePauliOp.sum(z_summands).simplify())
 
         # 4. add the identity operator
-        spin_op_encoding.append(PauliSumOp(1.0 * SparsePauliOp(pauli_id)))
+        spin_op_encoding.append(SparsePauliOp(pauli_id))
 
         # return the lookup table for the transformed XYZI operators
-        return spin_op_encoding
+        return tuple(spin_op_encoding)
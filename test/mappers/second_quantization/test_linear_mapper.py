@@ -1,6 +1,6 @@
 # This code is part of Qiskit.
 #
-# (C) Copyright IBM 2021.
+# (C) Copyright IBM 2021, 2026.
 #
 # This code is licensed under the Apache License, Version 2.0. You may
 # obtain a copy of this license in the LICENSE.txt file in the root directory
@@ -64,12 +64,20 @@ class TestLinearMapper(QiskitNatureTestCase):
         + (1.0 + 0j) * (I ^ I ^ I ^ I ^ I ^ I ^ I ^ I ^ I ^ I ^ I ^ I ^ I ^ I ^ Y ^ Y)
     )
 
+    spin_op6 = SpinOp([("X_0^3", 1.0)], 0.5, 1)
+    ref_qubit_op6 = 0.0625 * (X ^ X) + 0.0625 * (Y ^ Y)
+
+    spin_op7 = SpinOp([("X_0^4", 2.0)], 0.5, 1)
+    ref_qubit_op7 = 0.0625 * (I ^ I) - 0.0625 * (Z ^ Z)
+
     @data(
         (spin_op1, ref_qubit_op1),
         (spin_op2, ref_qubit_op2),
         (spin_op3, ref_qubit_op3),
         (spin_op4, ref_qubit_op4),
         (spin_op5, ref_qubit_op5),
+        (spin_op6, ref_qubit_op6),
+        (spin_op7, ref_qubit_op7),
     )
     @unpack
     def test_mapping(self, spin_op, ref_qubit_op):
@@ -78,6 +86,13 @@ class TestLinearMapper(QiskitNatureTestCase):
         qubit_op = mapper.map(spin_op)
         self.assertEqual(qubit_op, ref_qubit_op)
 
+    def test_encoding_is_cached(self):
+        """Test that the spin encoding is reused across mappings of the same spin"""
+        qubit_op = LinearMapper().map(self.spin_op4)
+        hits = LinearMapper._linear_encoding.cache_info().hits
+        self.assertEqual(LinearMapper().map(self.spin_op4), qubit_op)
+        self.assertGreater(LinearMapper._linear_encoding.cache_info().hits, hits)
+
 
 if __name__ == "__main__":
     unittest.main()